@@ -2,23 +2,27 @@
 import argparse
 import os
 import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-
 # -----------------------
 # Utilities
 # -----------------------
+# Longest suffix first so "MB" is not mistaken for "B"
+_SIZE_UNITS = {"TB": 1024**4, "GB": 1024**3, "MB": 1024**2, "KB": 1024, "B": 1}
+
+
 def parse_size(s: str) -> int:
     s = s.strip().upper().replace("_", "")
-    mults = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
-    for unit in ["TB", "GB", "MB", "KB", "B"]:
+    for unit, mult in _SIZE_UNITS.items():
         if s.endswith(unit):
             num = float(s[: -len(unit)].strip())
-            return int(num * mults[unit])
+            return int(num * mult)
     # allow raw integer bytes
     return int(s)
 
@@ -44,12 +48,25 @@ def compression_arg(name: str):
     return n
 
 
-def make_writer_kwargs(compression: str | None, compression_level: int | None) -> dict:
+def make_writer_kwargs(
+    compression: str | None,
+    compression_level: int | None,
+    data_page_size: int,
+    write_batch_size: int,
+) -> dict:
     # pyarrow supports compression_level for several codecs. If codec doesn't
     # support levels, pyarrow may ignore or error depending on version.
-    kw = {}
+    kw = {
+        # Sized for ~250k-row groups so the encoder flushes pages less often
+        "data_page_size": data_page_size,
+        "write_batch_size": write_batch_size,
+    }
     if compression is not None:
         kw["compression"] = compression
+        # zstd levels 1-5 are the "real-time" range; 3 is the ratio/speed knee
+        # for generated data and doesn't depend on the pyarrow build's default.
+        if compression_level is None and compression == "zstd":
+            compression_level = 3
         if compression_level is not None:
             kw["compression_level"] = compression_level
     else:
@@ -57,180 +74,427 @@ def make_writer_kwargs(compression: str | None, compression_level: int | None) -
     return kw
 
 
+def int_to_ascii(x: np.ndarray, max_digits: int) -> np.ndarray:
+    """
+    Format non-negative integers as decimal ASCII in a fixed-width ``|S`` array
+    (left-aligned, NUL-padded) without building per-row Python str objects.
+    """
+    x = np.asarray(x, dtype=np.int64)
+    n_digits = np.ones(len(x), dtype=np.int64)
+    for k in range(1, max_digits):
+        n_digits += x >= 10**k
+
+    pow10 = 10 ** np.arange(max_digits, dtype=np.int64)
+    out = np.zeros((len(x), max_digits), dtype=np.uint8)
+    for j in range(max_digits):
+        # j-th character from the left is the digit at 10**(n_digits-1-j)
+        exp = n_digits - 1 - j
+        digit = (x // pow10[np.maximum(exp, 0)]) % 10
+        out[:, j] = np.where(exp >= 0, digit + ord("0"), 0)
+    return out.view(f"S{max_digits}").ravel()
+
+
+def validity_bitmap(n_rows: int, null_rows: np.ndarray) -> pa.Buffer:
+    """Arrow validity bitmap (1 = valid) with the given row indices cleared."""
+    valid = np.ones(n_rows, dtype=bool)
+    valid[null_rows] = False
+    return pa.py_buffer(np.packbits(valid, bitorder="little"))
+
+
+def concat_strings(
+    n_rows: int, *parts, null_rows: np.ndarray | None = None
+) -> pa.StringArray:
+    """
+    Build an Arrow string array by concatenating per-row byte pieces directly
+    into offsets/values buffers (no per-row Python objects).
+
+    Each part is either a bytes constant (shared by every row) or a fixed-width
+    ``|S`` array of length n_rows, NUL-padded on the right as NumPy does.
+    ``null_rows`` (distinct row indices) become nulls via the validity bitmap.
+    """
+    # Lay every part side by side in one (n_rows, width) byte matrix; since the
+    # pieces never contain NUL, dropping the padding in row-major order leaves
+    # exactly the concatenated values buffer, and per-row counts give offsets.
+    cols = []
+    for part in parts:
+        if isinstance(part, bytes):
+            row = np.frombuffer(part, dtype=np.uint8)
+            cols.append(np.broadcast_to(row, (n_rows, len(part))))
+        else:
+            cols.append(part.view(np.uint8).reshape(n_rows, part.dtype.itemsize))
+    mat = np.hstack(cols)
+    present = mat != 0
+
+    # Accumulate in int64: an int32 cumsum would silently wrap past 2 GiB
+    offsets = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.count_nonzero(present, axis=1), out=offsets[1:])
+    if offsets[-1] > np.iinfo(np.int32).max:
+        raise ValueError(
+            f"String column needs {human_bytes(int(offsets[-1]))}, over the 2 GiB limit of "
+            f"32-bit Arrow offsets; use a smaller --row-group-rows."
+        )
+    offsets = offsets.astype(np.int32)
+    values = mat[present]
+
+    if null_rows is None:
+        return pa.StringArray.from_buffers(
+            n_rows, pa.py_buffer(offsets), pa.py_buffer(values)
+        )
+    return pa.StringArray.from_buffers(
+        n_rows,
+        pa.py_buffer(offsets),
+        pa.py_buffer(values),
+        validity_bitmap(n_rows, null_rows),
+        len(null_rows),
+    )
+
+
+def decimal_array(unscaled: np.ndarray, type: pa.Decimal128Type) -> pa.Array:
+    """
+    Wrap int64 unscaled values (e.g. cents for scale 2) as a Decimal128 array by
+    writing the 16-byte little-endian two's-complement words directly.
+    """
+    words = np.empty((len(unscaled), 2), dtype=np.int64)
+    words[:, 0] = unscaled
+    words[:, 1] = unscaled >> 63  # sign-extend into the high word
+    return pa.Array.from_buffers(type, len(unscaled), [None, pa.py_buffer(words)])
+
+
+def bool_array(mask: np.ndarray) -> pa.BooleanArray:
+    """Wrap a NumPy bool mask as an Arrow array from a pre-packed bitmap."""
+    packed = np.packbits(mask, bitorder="little")
+    return pa.Array.from_buffers(pa.bool_(), len(mask), [None, pa.py_buffer(packed)])
+
+
+def sparse_rows(rng: np.random.Generator, n_rows: int, p: float) -> np.ndarray:
+    """
+    Indices of the rows hit by an independent Bernoulli(p) per row, drawn
+    directly (binomial count + distinct positions) instead of thresholding
+    a dense float array. Meant for small p.
+    """
+    k = rng.binomial(n_rows, p)
+    return rng.choice(n_rows, size=k, replace=False)
+
+
 # -----------------------
 # "Real-ish" table generator
 # -----------------------
-def make_rowgroup(
-    n_rows: int,
-    rng: np.random.Generator,
-    base_id: int,
-    start_ts_ms: int,
-) -> pa.Table:
-    """
-    A mix of:
-      - ints, floats, decimals
-      - timestamps
-      - low-cardinality categories (dictionary-friendly)
-      - medium/high-cardinality strings (less compressible)
-      - json-ish payload
-      - nulls sprinkled in
-      - completely null columns (various types)
-      - non-uniform distributions (power-law, exponential, geometric)
-    """
+# Row-group invariants, built once instead of per row group
+_COUNTRY_CODES = pa.array(
+    [
+        "US",
+        "CA",
+        "GB",
+        "DE",
+        "FR",
+        "NL",
+        "SE",
+        "NO",
+        "ES",
+        "IT",
+        "BR",
+        "IN",
+        "JP",
+        "AU",
+    ],
+    type=pa.string(),
+)
+_CHANNELS = pa.array(
+    ["organic", "paid", "email", "referral", "social"], type=pa.string()
+)
+_PAGES = np.array(
+    [
+        b"/home",
+        b"/search",
+        b"/product",
+        b"/cart",
+        b"/checkout",
+        b"/account",
+        b"/help",
+    ]
+)
+
+_SCHEMA = pa.schema(
+    [
+        ("event_id", pa.int64()),
+        ("user_id", pa.int64()),
+        ("session_id", pa.int64()),
+        ("event_ts", pa.timestamp("ms")),
+        ("price", pa.decimal128(18, 2)),
+        ("quantity", pa.int16()),
+        ("score", pa.float32()),
+        ("latency_ms", pa.decimal128(18, 1)),
+        ("rating", pa.float32()),
+        ("is_refund", pa.bool_()),
+        ("is_mobile", pa.bool_()),
+        ("country", pa.dictionary(pa.int8(), pa.string())),
+        ("channel", pa.dictionary(pa.int8(), pa.string())),
+        ("product_sku", pa.string()),
+        ("url", pa.string()),
+        ("payload", pa.string()),
+        ("null_comment", pa.string()),
+        ("null_amount", pa.float64()),
+        ("null_updated_at", pa.timestamp("ms")),
+        ("null_flag", pa.bool_()),
+    ]
+)
+
+# Two-letter payload keys ("aa".."zz"): each little-endian uint16 entry holds the
+# ASCII bytes of one key, so a gather + view("S2") yields the keys directly.
+_KEY_IDX = np.arange(26 * 26, dtype=np.uint16)
+_KEY_LUT = ((ord("a") + _KEY_IDX % 26) << 8 | (ord("a") + _KEY_IDX // 26)).astype("<u2")
+
+# Arrow arrays are immutable, so the all-null columns for a given row count can
+# be built once and shared by every row group.
+_NULL_COLUMNS: dict[int, dict[str, pa.Array]] = {}
+
+
+_ROW_OFFSETS: dict[int, np.ndarray] = {}
+
+
+def row_offsets(n_rows: int) -> np.ndarray:
+    # 0..n_rows-1, shared read-only so ids are a single add per row group
+    offsets = _ROW_OFFSETS.get(n_rows)
+    if offsets is None:
+        offsets = np.arange(n_rows, dtype=np.int64)
+        offsets.flags.writeable = False
+        _ROW_OFFSETS[n_rows] = offsets
+    return offsets
+
+
+def null_columns(n_rows: int) -> dict[str, pa.Array]:
+    cols = _NULL_COLUMNS.get(n_rows)
+    if cols is None:
+        cols = {
+            "null_comment": pa.nulls(n_rows, pa.string()),
+            "null_amount": pa.nulls(n_rows, pa.float64()),
+            "null_updated_at": pa.nulls(n_rows, pa.timestamp("ms")),
+            "null_flag": pa.nulls(n_rows, pa.bool_()),
+        }
+        _NULL_COLUMNS[n_rows] = cols
+    return cols
+
+
+# Each draw_* function below owns one group of columns and its own RNG stream,
+# so the groups can be generated concurrently; together they return the
+# columns in table order. Plain numeric columns come back as NumPy arrays whose
+# dtype already matches _SCHEMA, so pa.table() adopts their buffers without a copy.
+def draw_identifiers(
+    rng: np.random.Generator, n_rows: int, base_id: int, start_ts_ms: int
+) -> dict[str, np.ndarray]:
     # Core identifiers
-    ids = np.arange(base_id, base_id + n_rows, dtype=np.int64)
+    offsets = row_offsets(n_rows)
+    ids = offsets + base_id
 
     # Power-law / Zipf-ish user_id: a small set of users generate most events
-    raw_zipf = rng.zipf(a=1.5, size=n_rows)
-    user_id = (raw_zipf % 5_000_000 + 1).astype(np.int64)
+    # (zipf already returns int64, so fold it into range in place)
+    user_id = rng.zipf(a=1.5, size=n_rows)
+    np.remainder(user_id, 5_000_000, out=user_id)
+    user_id += 1
 
     session_id = rng.integers(1, 50_000_000, size=n_rows, dtype=np.int64)
 
     # Timestamps (event stream-ish)
-    # jitter within a window, plus monotonic-ish drift
-    ts = (
-        start_ts_ms
-        + ids % (7 * 24 * 3600 * 1000)
-        + rng.integers(0, 2000, size=n_rows, dtype=np.int64)
-    )
+    # jitter within a window, plus monotonic-ish drift — accumulated in one buffer
+    week_ms = 7 * 24 * 3600 * 1000
+    ts = rng.integers(0, 2000, size=n_rows, dtype=np.int64)
+    ts += start_ts_ms
+    if base_id % week_ms + n_rows <= week_ms:
+        # ids % week is just the shifted offsets unless this group wraps the window
+        ts += offsets
+        ts += base_id % week_ms
+    else:
+        ts += ids % week_ms
+
+    return {
+        "event_id": ids,
+        "user_id": user_id,
+        "session_id": session_id,
+        "event_ts": ts,
+    }
+
 
+def draw_measures(
+    rng: np.random.Generator, n_rows: int
+) -> dict[str, np.ndarray | pa.Array]:
     # Numerics — intentionally non-uniform distributions
+    # Same-distribution draws are pooled into one Generator call and sliced
+    normals = rng.standard_normal((2, n_rows), dtype=np.float32)
+
     # Price: lognormal (long right tail — most items cheap, some very expensive)
-    price = np.round(rng.lognormal(mean=2.8, sigma=1.2, size=n_rows), 2).astype(
-        np.float64
-    )
+    # exp(mu + sigma * z) from float32 normals, kept as exact cents: decimals
+    # compress far better than float64s carrying rounding noise.
+    price = np.multiply(normals[0], 1.2, dtype=np.float64)
+    price += 2.8
+    np.exp(price, out=price)
+    price *= 100
+    price_cents = np.rint(price, out=price).astype(np.int64)
 
     # Quantity: geometric distribution (most orders = 1 item, exponential decay)
-    quantity = rng.geometric(p=0.45, size=n_rows).astype(np.int16)
+    # via inverse CDF: floor(log(1 - U) / log(1 - p)) + 1, from float32 uniforms
+    u = rng.random(n_rows, dtype=np.float32)
+    np.log1p(-u, out=u)
+    u /= np.log1p(np.float32(-0.45))
+    quantity = np.floor(u, out=u).astype(np.int16)
+    quantity += 1
 
     # Score: normal / bell curve (mean=0, std=1)
-    score = rng.standard_normal(n_rows).astype(np.float32)
+    score = normals[1]
 
     # Latency: exponential distribution (most requests fast, long tail of slow ones)
-    latency_ms = np.round(rng.exponential(scale=120.0, size=n_rows), 1).astype(
-        np.float64
+    # (in tenths of a millisecond, stored as decimal(18, 1))
+    latency = np.multiply(
+        rng.standard_exponential(n_rows, dtype=np.float32), 1200.0, dtype=np.float64
     )
+    latency_tenths = np.rint(latency, out=latency).astype(np.int64)
 
     # Rating: beta distribution scaled to 1-5 (skewed toward high ratings)
-    rating = np.round(rng.beta(a=5.0, b=2.0, size=n_rows) * 4 + 1, 1).astype(np.float32)
-
+    # Beta(a, b) = Ga / (Ga + Gb), which lets every draw stay float32
+    ga = rng.standard_gamma(5.0, n_rows, dtype=np.float32)
+    gb = rng.standard_gamma(2.0, n_rows, dtype=np.float32)
+    rating = ga / (ga + gb)
+    rating *= 4
+    rating += 1
+    np.round(rating, 1, out=rating)
+
+    return {
+        "price": decimal_array(price_cents, _SCHEMA.field("price").type),
+        "quantity": quantity,
+        "score": score,
+        "latency_ms": decimal_array(latency_tenths, _SCHEMA.field("latency_ms").type),
+        "rating": rating,
+    }
+
+
+def draw_flags(rng: np.random.Generator, n_rows: int) -> dict[str, pa.Array]:
     # Booleans / flags
-    is_refund = rng.random(n_rows) < 0.02
-    is_mobile = rng.random(n_rows) < 0.55
+    # float32 uniforms are plenty for these thresholds at half the scratch bytes
+    u = rng.random((2, n_rows), dtype=np.float32)
+    is_refund = u[0] < 0.02
+    is_mobile = u[1] < 0.55
+    return {
+        "is_refund": bool_array(is_refund),
+        "is_mobile": bool_array(is_mobile),
+    }
 
+
+def draw_dimensions(rng: np.random.Generator, n_rows: int) -> dict[str, pa.Array]:
     # Low-cardinality dimensions (great for dictionary encoding)
-    country_codes = np.array(
-        [
-            "US",
-            "CA",
-            "GB",
-            "DE",
-            "FR",
-            "NL",
-            "SE",
-            "NO",
-            "ES",
-            "IT",
-            "BR",
-            "IN",
-            "JP",
-            "AU",
-        ],
-        dtype=object,
+    country_idx = rng.integers(0, len(_COUNTRY_CODES), size=n_rows, dtype=np.int8)
+    # Make about 1% of country null
+    country_nulls = sparse_rows(rng, n_rows, 0.01)
+    # Hand Arrow the index draws as a dictionary array; no per-row strings
+    country = pa.DictionaryArray.from_arrays(
+        pa.Array.from_buffers(
+            pa.int8(),
+            n_rows,
+            [validity_bitmap(n_rows, country_nulls), pa.py_buffer(country_idx)],
+            len(country_nulls),
+        ),
+        _COUNTRY_CODES,
     )
-    country = country_codes[rng.integers(0, len(country_codes), size=n_rows)]
 
-    channel_vals = np.array(
-        ["organic", "paid", "email", "referral", "social"], dtype=object
-    )
-    channel = channel_vals[rng.integers(0, len(channel_vals), size=n_rows)]
+    channel_idx = rng.integers(0, len(_CHANNELS), size=n_rows, dtype=np.int8)
+    channel = pa.DictionaryArray.from_arrays(pa.array(channel_idx), _CHANNELS)
+
+    return {"country": country, "channel": channel}
 
+
+def draw_product_sku(rng: np.random.Generator, n_rows: int) -> dict[str, pa.Array]:
     # Medium-cardinality product-ish strings
     # product_sku like "SKU-ABCDE-1234"
-    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), dtype="<U1")
-    sku_letters = rng.choice(letters, size=(n_rows, 5))
+    # Draw ASCII bytes directly; the C-contiguous (n, 5) block reinterprets as |S5
+    sku_letters = rng.integers(ord("A"), ord("Z") + 1, size=(n_rows, 5), dtype=np.uint8)
+    sku_block = sku_letters.view("S5").reshape(n_rows)
     sku_nums = rng.integers(0, 10_000, size=n_rows)
-    product_sku = np.char.add(
-        np.char.add("SKU-", np.apply_along_axis("".join, 1, sku_letters)),
-        np.char.add("-", sku_nums.astype(str)),
-    )
+    return {
+        "product_sku": concat_strings(
+            n_rows, b"SKU-", sku_block, b"-", int_to_ascii(sku_nums, 4)
+        )
+    }
 
+
+def draw_url(rng: np.random.Generator, n_rows: int) -> dict[str, pa.Array]:
     # URL-ish path (some repetition, some variability)
-    pages = np.array(
-        ["/home", "/search", "/product", "/cart", "/checkout", "/account", "/help"],
-        dtype=object,
-    )
-    page = pages[rng.integers(0, len(pages), size=n_rows)]
+    page = _PAGES[rng.integers(0, len(_PAGES), size=n_rows, dtype=np.int8)]
     q = rng.integers(0, 10_000_000, size=n_rows)
-    url = np.char.add(np.char.add(page.astype(str), "?q="), q.astype(str))
+    # Make about 3% of url null
+    url_nulls = sparse_rows(rng, n_rows, 0.03)
+    return {
+        "url": concat_strings(
+            n_rows, page, b"?q=", int_to_ascii(q, 7), null_rows=url_nulls
+        )
+    }
 
+
+def draw_payload(rng: np.random.Generator, n_rows: int) -> dict[str, pa.Array]:
     # JSON-ish payload: small, but not perfectly compressible
     # Example: {"ab":123,"cd":456,"ok":true}
-    k1 = rng.integers(0, 26**2, size=n_rows)
-    k2 = rng.integers(0, 26**2, size=n_rows)
-    v1 = rng.integers(0, 10_000, size=n_rows)
-    v2 = rng.integers(0, 10_000, size=n_rows)
-    ok = rng.random(n_rows) < 0.8
-
-    def two_letter(x: np.ndarray) -> np.ndarray:
-        a = (x // 26).astype(np.int32)
-        b = (x % 26).astype(np.int32)
-        return np.char.add(
-            np.char.add(np.array(list("abcdefghijklmnopqrstuvwxyz"))[a], ""),
-            np.array(list("abcdefghijklmnopqrstuvwxyz"))[b],
-        )
-
-    key1 = two_letter(k1)
-    key2 = two_letter(k2)
-    payload = np.char.add(
-        np.char.add(np.char.add('{"', key1), np.char.add('":', v1.astype(str))),
-        np.char.add(
-            np.char.add(',"', key2),
-            np.char.add(
-                np.char.add('":', v2.astype(str)),
-                np.where(ok, ',"ok":true}', ',"ok":false}'),
-            ),
-        ),
+    # Both keys and both values come from one pooled draw each
+    keys = _KEY_LUT[rng.integers(0, 26**2, size=(2, n_rows), dtype=np.uint16)]
+    key1, key2 = keys.view("S2")
+    vals = int_to_ascii(rng.integers(0, 10_000, size=2 * n_rows), 4)
+    v1, v2 = vals.reshape(2, n_rows)
+    ok = rng.random(n_rows, dtype=np.float32) < 0.8
+
+    payload = concat_strings(
+        n_rows,
+        b'{"',
+        key1,
+        b'":',
+        v1,
+        b',"',
+        key2,
+        b'":',
+        v2,
+        np.where(ok, b',"ok":true}', b',"ok":false}'),
     )
+    return {"payload": payload}
+
+
+def make_rowgroup(
+    n_rows: int,
+    rng: np.random.Generator,
+    base_id: int,
+    start_ts_ms: int,
+    pool: Executor | None = None,
+) -> pa.Table:
+    """
+    A mix of:
+      - ints, floats, decimals
+      - timestamps
+      - low-cardinality categories (dictionary-friendly)
+      - medium/high-cardinality strings (less compressible)
+      - json-ish payload
+      - nulls sprinkled in
+      - completely null columns (various types)
+      - non-uniform distributions (power-law, exponential, geometric)
 
-    # Sprinkle nulls (common in real data)
-    # Make about 3% of url and 1% of country null
-    url_mask = rng.random(n_rows) < 0.03
-    country_mask = rng.random(n_rows) < 0.01
-    url = url.astype(object)
-    country = country.astype(object)
-    url[url_mask] = None
-    country[country_mask] = None
+    Column groups draw from independent child streams of ``rng``; pass ``pool``
+    to generate them concurrently (NumPy releases the GIL for bulk draws).
+    """
+    streams = rng.spawn(7)
+    jobs = [
+        partial(draw_identifiers, streams[0], n_rows, base_id, start_ts_ms),
+        partial(draw_measures, streams[1], n_rows),
+        partial(draw_flags, streams[2], n_rows),
+        partial(draw_dimensions, streams[3], n_rows),
+        partial(draw_product_sku, streams[4], n_rows),
+        partial(draw_url, streams[5], n_rows),
+        partial(draw_payload, streams[6], n_rows),
+    ]
+    if pool is None:
+        groups = [job() for job in jobs]
+    else:
+        groups = [f.result() for f in [pool.submit(job) for job in jobs]]
 
+    # The explicit schema means no type inference (explicit types help stability)
+    columns = {}
+    for group in groups:
+        columns.update(group)
     # Completely null columns (various types — tests null handling paths)
-    all_nulls = [None] * n_rows
-
-    # Build Arrow arrays (explicit types help stability)
-    return pa.table(
-        {
-            "event_id": pa.array(ids, type=pa.int64()),
-            "user_id": pa.array(user_id, type=pa.int64()),
-            "session_id": pa.array(session_id, type=pa.int64()),
-            "event_ts": pa.array(ts, type=pa.timestamp("ms")),
-            "price": pa.array(price, type=pa.float64()),
-            "quantity": pa.array(quantity, type=pa.int16()),
-            "score": pa.array(score, type=pa.float32()),
-            "latency_ms": pa.array(latency_ms, type=pa.float64()),
-            "rating": pa.array(rating, type=pa.float32()),
-            "is_refund": pa.array(is_refund, type=pa.bool_()),
-            "is_mobile": pa.array(is_mobile, type=pa.bool_()),
-            "country": pa.array(country, type=pa.string()),
-            "channel": pa.array(channel, type=pa.string()),
-            "product_sku": pa.array(product_sku, type=pa.string()),
-            "url": pa.array(url, type=pa.string()),
-            "payload": pa.array(payload, type=pa.string()),
-            # All-null columns (different types)
-            "null_comment": pa.array(all_nulls, type=pa.string()),
-            "null_amount": pa.array(all_nulls, type=pa.float64()),
-            "null_updated_at": pa.array(all_nulls, type=pa.timestamp("ms")),
-            "null_flag": pa.array(all_nulls, type=pa.bool_()),
-        }
-    )
+    columns.update(null_columns(n_rows))
+    return pa.table(columns, schema=_SCHEMA)
 
 
 # -----------------------
@@ -242,6 +506,8 @@ def write_to_target(
     row_group_rows: int,
     compression: str | None,
     compression_level: int | None,
+    data_page_size: int,
+    write_batch_size: int,
     use_dictionary: bool,
     seed: int,
     overshoot_pct: float,
@@ -253,40 +519,111 @@ def write_to_target(
     rng = np.random.default_rng(seed)
     start_ts_ms = int(time.time() * 1000)
 
-    writer = None
     row_groups = 0
     base_id = 0
 
-    writer_kwargs = make_writer_kwargs(compression, compression_level)
+    writer_kwargs = make_writer_kwargs(
+        compression, compression_level, data_page_size, write_batch_size
+    )
 
-    try:
-        while True:
-            tbl = make_rowgroup(
-                row_group_rows, rng, base_id=base_id, start_ts_ms=start_ts_ms
-            )
-            if writer is None:
-                writer = pq.ParquetWriter(
-                    where=str(out_path),
-                    schema=tbl.schema,
-                    use_dictionary=use_dictionary,
-                    **writer_kwargs,
-                )
-            writer.write_table(tbl)
+    def submit_rowgroup(base_id: int) -> Future:
+        # Each row group draws from its own spawned stream, so output stays
+        # repeatable no matter how generation and writing interleave.
+        return rowgroup_pool.submit(
+            make_rowgroup,
+            row_group_rows,
+            rng.spawn(1)[0],
+            base_id=base_id,
+            start_ts_ms=start_ts_ms,
+            pool=column_pool,
+        )
 
-            row_groups += 1
-            base_id += row_group_rows
+    # Write through our own sink so the running size is just sink.tell()
+    # rather than a stat() syscall per row group. The 4 MiB buffer coalesces
+    # the encoder's many small page writes into fewer write(2) calls; tell()
+    # counts buffered bytes, so checking the size never forces a flush.
+    raw = pa.OSFile(str(out_path), "wb")
+    sink = pa.BufferedOutputStream(raw, buffer_size=4 << 20)
+    writer = None
+    preallocated = False
+    try:
+        writer = pq.ParquetWriter(
+            where=sink,
+            schema=_SCHEMA,
+            use_dictionary=use_dictionary,
+            **writer_kwargs,
+        )
 
-            size = out_path.stat().st_size
-            # stop when we hit target, allowing small overshoot to avoid thrashing near boundary
-            if size >= target_bytes * (1.0 + overshoot_pct):
-                return size
-            if row_groups >= max_row_groups:
-                raise RuntimeError(
-                    f"Hit max_row_groups={max_row_groups} before reaching {human_bytes(target_bytes)} (got {human_bytes(size)})."
+        # Reserve the expected extent up front so the filesystem can lay the file
+        # out contiguously instead of extending it row group by row group; the
+        # unused tail is trimmed in the finally below. Done only once the writer
+        # exists, so a bad codec/level fails before any space is reserved.
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(
+                    raw.fileno(), 0, int(target_bytes * (1.0 + overshoot_pct))
                 )
+                preallocated = True
+            except OSError:
+                pass
+
+        # Build row group N+1 in the background while the writer encodes row group N;
+        # within a row group, column groups are drawn in parallel on column_pool.
+        with (
+            ThreadPoolExecutor(max_workers=os.cpu_count()) as column_pool,
+            ThreadPoolExecutor(max_workers=1) as rowgroup_pool,
+        ):
+            # stop when we hit target, allowing small overshoot to avoid thrashing near boundary
+            stop_at = target_bytes * (1.0 + overshoot_pct)
+            last_rg_bytes = 0
+            pending = submit_rowgroup(base_id)
+            try:
+                while True:
+                    tbl = pending.result()
+                    size = sink.tell()
+                    # Only prefetch when this row group is not expected to be the
+                    # last one (judged by how much the previous one added), so we
+                    # don't build a row group past the target just to discard it.
+                    pending = None
+                    if (
+                        size + last_rg_bytes < stop_at
+                        and row_groups + 1 < max_row_groups
+                    ):
+                        pending = submit_rowgroup(base_id + row_group_rows)
+                    writer.write_table(tbl)
+
+                    row_groups += 1
+                    base_id += row_group_rows
+
+                    last_rg_bytes = sink.tell() - size
+                    size += last_rg_bytes
+                    if size >= stop_at:
+                        break
+                    if row_groups >= max_row_groups:
+                        raise RuntimeError(
+                            f"Hit max_row_groups={max_row_groups} before reaching {human_bytes(target_bytes)} (got {human_bytes(size)})."
+                        )
+                    if pending is None:
+                        # The estimate was short; build the next row group now
+                        pending = submit_rowgroup(base_id)
+            finally:
+                if pending is not None:
+                    pending.cancel()
     finally:
-        if writer is not None:
-            writer.close()
+        # Each step must still run if the one before it raises, so the
+        # reservation is always trimmed back to the bytes actually written.
+        try:
+            if writer is not None:
+                writer.close()
+        finally:
+            written = sink.tell()
+            try:
+                sink.close()  # flushes the buffer and closes raw
+            finally:
+                if preallocated:
+                    os.truncate(out_path, written)
+
+    return out_path.stat().st_size
 
 
 def main():
@@ -308,7 +645,7 @@ def main():
         "--compression-level",
         type=int,
         default=None,
-        help="Compression level (codec-dependent)",
+        help="Compression level (codec-dependent; zstd defaults to 3)",
     )
     ap.add_argument(
         "--row-group-rows",
@@ -316,6 +653,18 @@ def main():
         default=250_000,
         help="Rows per row group (affects memory + file structure)",
     )
+    ap.add_argument(
+        "--data-page-size",
+        type=parse_size,
+        default="1MB",
+        help="Target Parquet data page size, e.g. 1MB",
+    )
+    ap.add_argument(
+        "--write-batch-size",
+        type=int,
+        default=10_000,
+        help="Rows the encoder processes per batch within a page",
+    )
     ap.add_argument(
         "--dictionary",
         action="store_true",
@@ -369,12 +718,17 @@ def main():
             row_group_rows=args.row_group_rows,
             compression=compression,
             compression_level=args.compression_level,
+            data_page_size=args.data_page_size,
+            write_batch_size=args.write_batch_size,
             use_dictionary=args.dictionary,
             seed=args.seed,
             overshoot_pct=args.overshoot,
             max_row_groups=args.max_row_groups,
         )
-        print(f"Done: {human_bytes(final_size)}")
+        n_rows = pq.ParquetFile(out_path).metadata.num_rows
+        print(
+            f"Done: {human_bytes(final_size)} ({n_rows:,} rows, {final_size / n_rows:.1f} B/row)"
+        )
 
 
 if __name__ == "__main__":